@@ -68,13 +68,18 @@ class EnvManager(ABC):
         pass
 
     def advance(self):
-        # Get new policies if found
+        # Get new policies if found. Drain the whole queue so that policies published
+        # faster than we step don't pile up in it; only the newest one needs to be set.
         for brain_name in self.external_brains:
-            try:
-                _policy = self.agent_managers[brain_name].policy_queue.get_nowait()
-                self.set_policy(brain_name, _policy)
-            except AgentManagerQueue.Empty:
-                pass
+            policy_queue = self.agent_managers[brain_name].policy_queue
+            latest_policy = None
+            while True:
+                try:
+                    latest_policy = policy_queue.get_nowait()
+                except AgentManagerQueue.Empty:
+                    break
+            if latest_policy is not None:
+                self.set_policy(brain_name, latest_policy)
         # Step the environment
         new_step_infos = self._step()
         # Add to AgentProcessor
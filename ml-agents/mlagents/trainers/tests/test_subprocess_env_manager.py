@@ -9,6 +9,7 @@ from mlagents.trainers.subprocess_env_manager import (
     StepResponse,
 )
 from mlagents.trainers.env_manager import EnvironmentStep
+from mlagents.trainers.agent_processor import AgentManagerQueue
 from mlagents_envs.base_env import BaseEnv
 from mlagents_envs.side_channel.engine_configuration_channel import EngineConfig
 
@@ -124,6 +125,9 @@ class SubprocessEnvManagerTest(unittest.TestCase):
         )
         external_brains_mock.return_value = [brain_name]
         agent_manager_mock = mock.Mock()
+        agent_manager_mock.policy_queue.get_nowait.side_effect = (
+            AgentManagerQueue.Empty()
+        )
         env_manager.set_agent_manager(brain_name, agent_manager_mock)
 
         step_info_dict = {brain_name: Mock()}
@@ -142,7 +146,22 @@ class SubprocessEnvManagerTest(unittest.TestCase):
 
         # Test policy queue
         mock_policy = mock.Mock()
-        agent_manager_mock.policy_queue.get_nowait.return_value = mock_policy
+        agent_manager_mock.policy_queue.get_nowait.side_effect = [
+            mock_policy,
+            AgentManagerQueue.Empty(),
+        ]
         env_manager.advance()
         assert env_manager.policies[brain_name] == mock_policy
         assert agent_manager_mock.policy == mock_policy
+
+        # Test that all pending policies are consumed in a single advance
+        old_policy = mock.Mock()
+        new_policy = mock.Mock()
+        agent_manager_mock.policy_queue.get_nowait.side_effect = [
+            old_policy,
+            new_policy,
+            AgentManagerQueue.Empty(),
+        ]
+        env_manager.advance()
+        assert env_manager.policies[brain_name] == new_policy
+        assert agent_manager_mock.policy == new_policy